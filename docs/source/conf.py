@@ -1,5 +1,6 @@
 """Configure QRDM Sphinx Documentation."""
 
+import os
 from importlib import metadata
 
 # -- Project information -----------------------------------------------------
@@ -18,13 +19,21 @@ version = release.rsplit(".", 1)[0]
 extensions = [
     "sphinx.ext.autosummary",
     "sphinx.ext.autodoc",
-    "sphinx.ext.doctest",
-    "sphinx.ext.githubpages",
     "sphinx.ext.viewcode",
     "sphinx.ext.napoleon",
     "myst_parser",
 ]
 
+# Builder-specific extensions contribute setup time without affecting other
+# builders' output. Set `SPHINXBUILDER` to match the `-b` flag of the build
+# invocation to load only the extensions that builder needs; when unset, all
+# extensions are enabled so any builder keeps working.
+_builder = os.environ.get("SPHINXBUILDER")
+if _builder in (None, "doctest"):
+    extensions.append("sphinx.ext.doctest")
+if _builder in (None, "html", "dirhtml"):
+    extensions.append("sphinx.ext.githubpages")
+
 # Add any paths that contain templates here, relative to this directory.
 templates_path = ["_templates"]
 
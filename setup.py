@@ -6,6 +6,43 @@
 # All meaningful setup configuration is contained in pyproject.toml
 """Shim for `setup.py` invocations."""
 
+import importlib
+import runpy
+from pathlib import Path
+
 import setuptools
+from setuptools.command.build_py import build_py
+
+_GENERATOR_SCRIPTS = (
+    Path(__file__).parent / "tools" / "gen_qr_capacity_table.py",
+    Path(__file__).parent / "tools" / "gen_protobuf_constants.py",
+)
+
+
+class build_py_with_generated_modules(build_py):
+    """Regenerate the generated constant modules before building the package."""
+
+    def run(self):
+        """Run the generator scripts, then the standard `build_py` steps."""
+        # Keeps src/qrdm/qr/_qr_capacity_table.py and
+        # src/qrdm/qr/protobuf/_constants.py in sync with their sources; the
+        # scripts are absent when building from a wheel, where the generated
+        # modules are already present
+        for script in _GENERATOR_SCRIPTS:
+            if not script.exists():
+                continue
+            if script.name == "gen_protobuf_constants.py":
+                try:
+                    importlib.import_module("google.protobuf")
+                except ImportError:
+                    # PEP 517 isolated builds only provide setuptools, not the
+                    # protobuf runtime the generator imports. The generated
+                    # module is checked in and its value is pinned by
+                    # `test_protobuf_reserved_len_in_sync`, so skipping the
+                    # regeneration here is safe.
+                    continue
+            runpy.run_path(str(script), run_name="__main__")
+        super().run()
+
 
-setuptools.setup()
+setuptools.setup(cmdclass={"build_py": build_py_with_generated_modules})
@@ -2,9 +2,28 @@
 # Subject to FAR 52.227-11 - Patent Rights - Ownership by the Contractor (May 2014).
 # SPDX-License-Identifier: MIT
 """QRDM provides tools for encoding and decoding documents as a series of QR codes."""
+from typing import TYPE_CHECKING
+
 __version__ = "2.1.0"
 
-from qrdm.qr.decode import decode_qr_pdf
-from qrdm.qr.encode import encode_qr_pdf
+if TYPE_CHECKING:
+    from qrdm.qr.decode import decode_qr_pdf
+    from qrdm.qr.encode import encode_qr_pdf
 
 __all__ = ["decode_qr_pdf", "encode_qr_pdf"]
+
+
+def __getattr__(name: str):
+    # Lazily resolve the public API so that `import qrdm` doesn't pay the import
+    # cost of the QR & PDF libraries until they are actually used.
+    if name == "decode_qr_pdf":
+        from qrdm.qr.decode import decode_qr_pdf
+
+        globals()[name] = decode_qr_pdf
+        return decode_qr_pdf
+    if name == "encode_qr_pdf":
+        from qrdm.qr.encode import encode_qr_pdf
+
+        globals()[name] = encode_qr_pdf
+        return encode_qr_pdf
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,12 +7,20 @@ from qrdm.backend.config import configure_app_logging
 
 configure_app_logging()
 
-try:
-    from qrdm.backend.main import app
-except ImportError as e:
-    raise ImportError(
-        f"Could not import backend dependency {e.name}. "
-        "You can fix this by running `pip install qrdm[backend]`."
-    ) from e
-
 __all__ = ["app"]
+
+
+def __getattr__(name: str):
+    # Defer the FastAPI app construction (and its QR encode/decode import chain)
+    # until `app` is actually requested, e.g. by uvicorn's `qrdm.backend:app`.
+    if name == "app":
+        try:
+            from qrdm.backend.main import app
+        except ImportError as e:
+            raise ImportError(
+                f"Could not import backend dependency {e.name}. "
+                "You can fix this by running `pip install qrdm[backend]`."
+            ) from e
+        globals()[name] = app
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,20 +2,32 @@
 # Subject to FAR 52.227-11 - Patent Rights - Ownership by the Contractor (May 2014).
 # SPDX-License-Identifier: MIT
 """Configuration of the QRDM FastAPI Application."""
+from __future__ import annotations
+
 import logging
+import os
 import sys
+from dataclasses import dataclass
 from enum import Enum
-from functools import lru_cache
 
 import structlog
-from pydantic_settings import BaseSettings
 from structlog.types import EventDict, Processor
 
-from qrdm.models import ECSettingValues
-
 __all__ = ["BackendSettings", "get_backend_settings", "configure_app_logging"]
 
 
+# Local copy of `qrdm.models.ECSettingValues`, which must stay in sync with it.
+# Importing it from `qrdm.models` would drag the protobuf runtime into the
+# backend configuration import path just to read four string values.
+class ECSettingValues(str, Enum):
+    """Valid settings for QR error correction levels."""
+
+    L = "LOW"
+    M = "MEDIUM"
+    Q = "QUARTILE"
+    H = "HIGH"
+
+
 class LogLevelValues(str, Enum):
     DEBUG = "DEBUG"
     INFO = "INFO"
@@ -24,19 +36,65 @@ class LogLevelValues(str, Enum):
     CRITICAL = "CRITICAL"
 
 
-class BackendSettings(BaseSettings):
-    """Pydantic-settings object for QRDM FastAPI Application."""
+_BOOL_STRS = {
+    "1": True,
+    "true": True,
+    "yes": True,
+    "on": True,
+    "0": False,
+    "false": False,
+    "no": False,
+    "off": False,
+}
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting from the environment."""
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return _BOOL_STRS[raw.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Invalid boolean value for {name}: {raw!r}") from None
+
+
+@dataclass(frozen=True)
+class BackendSettings:
+    """Environment-derived settings for the QRDM FastAPI Application.
+
+    These four env vars don't justify the pydantic-settings import cost on the
+    backend cold path, so they are read with explicit `os.environ` parsing.
+    """
 
     QRDM_ERROR_TOLERANCE: ECSettingValues = ECSettingValues.M
     QRDM_ENCODE_EC_CODES: bool = True
     QRDM_LOG_LEVEL: LogLevelValues = LogLevelValues.INFO
     QRDM_JSON_LOGS: bool = False
 
+    @classmethod
+    def from_environ(cls) -> BackendSettings:
+        """Construct settings from environment variables, keeping field defaults."""
+        return cls(
+            QRDM_ERROR_TOLERANCE=ECSettingValues(
+                os.environ.get("QRDM_ERROR_TOLERANCE", ECSettingValues.M.value)
+            ),
+            QRDM_ENCODE_EC_CODES=_env_bool("QRDM_ENCODE_EC_CODES", True),
+            QRDM_LOG_LEVEL=LogLevelValues(
+                os.environ.get("QRDM_LOG_LEVEL", LogLevelValues.INFO.value).upper()
+            ),
+            QRDM_JSON_LOGS=_env_bool("QRDM_JSON_LOGS", False),
+        )
+
+
+# Settings are resolved once at import; `configure_app_logging` already forces
+# this module to load before the application starts serving requests
+_SETTINGS = BackendSettings.from_environ()
+
 
-@lru_cache
 def get_backend_settings() -> BackendSettings:
-    """Return a cached instance of the application settings."""
-    return BackendSettings()
+    """Return the singleton instance of the application settings."""
+    return _SETTINGS
 
 
 # Adapted from https://gist.github.com/nymous/f138c7f06062b7c43c060bf03759c29e
@@ -51,23 +109,27 @@ def drop_color_message_key(_, __, event_dict: EventDict) -> EventDict:
     return event_dict
 
 
+# Processor instances are stateless, so they are constructed once at module load
+# rather than on every `configure_app_logging` call
+_TIMESTAMPER = structlog.processors.TimeStamper(fmt="iso")
+_SHARED_PROCESSORS_BASE: tuple[Processor, ...] = (
+    structlog.contextvars.merge_contextvars,
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.PositionalArgumentsFormatter(),
+    structlog.stdlib.ExtraAdder(),
+    drop_color_message_key,
+    _TIMESTAMPER,
+    structlog.processors.StackInfoRenderer(),
+    structlog.processors.UnicodeDecoder(),
+)
+
+
 def configure_app_logging() -> None:
     """Configure the `structlog` logging pipeline of the FastAPI Application."""
     app_settings = get_backend_settings()
 
-    timestamper = structlog.processors.TimeStamper(fmt="iso")
-
-    shared_processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.stdlib.ExtraAdder(),
-        drop_color_message_key,
-        timestamper,
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.UnicodeDecoder(),
-    ]
+    shared_processors: list[Processor] = list(_SHARED_PROCESSORS_BASE)
 
     if app_settings.QRDM_JSON_LOGS:
         # Format the exception only for JSON logs, as we want to pretty-print them when
@@ -112,15 +174,17 @@ def configure_app_logging() -> None:
     for _log in ["uvicorn", "uvicorn.error"]:
         # Clear the log handlers for uvicorn loggers, and enable propagation so the
         # messages are caught by our root logger and formatted correctly by structlog
-        logging.getLogger(_log).handlers.clear()
-        logging.getLogger(_log).propagate = True
+        uvicorn_logger = logging.getLogger(_log)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
 
     # Since we re-create the access logs ourselves, to add all information in the
     # structured log (see the `logging_middleware` in main.py), we clear the handlers
     # and prevent the logs to propagate to a logger higher up in the hierarchy
     # (effectively rendering them silent).
-    logging.getLogger("uvicorn.access").handlers.clear()
-    logging.getLogger("uvicorn.access").propagate = False
+    uvicorn_access_logger = logging.getLogger("uvicorn.access")
+    uvicorn_access_logger.handlers.clear()
+    uvicorn_access_logger.propagate = False
 
     def handle_exception(exc_type, exc_value, exc_traceback):
         """Log any uncaught exception instead of letting it be printed by Python.
@@ -3,7 +3,8 @@
 # SPDX-License-Identifier: MIT
 """Construct QRDM FastAPI Application."""
 
-import uuid
+import logging
+import os
 
 import structlog
 from fastapi import FastAPI, Request, Response
@@ -13,7 +14,16 @@ from qrdm import __version__ as VERSION
 from qrdm.backend.routers import qr
 
 __all__ = ["app"]
+# Fetch the access logger once at module load; re-binding it per request would
+# repeat the logger-factory lookup on every call
 access_logger = structlog.stdlib.get_logger("qrdm.access")
+# stdlib handle to the same logger, for cheap level checks in the middleware
+_access_std_logger = logging.getLogger("qrdm.access")
+_clear_contextvars = structlog.contextvars.clear_contextvars
+_bind_contextvars = structlog.contextvars.bind_contextvars
+# Pre-formatted protocol strings for the handful of HTTP versions in the wild,
+# so the access-log line doesn't need a nested f-string per request
+_HTTP_VERSION_STRS = {"1.0": "HTTP/1.0", "1.1": "HTTP/1.1", "2": "HTTP/2"}
 
 app = FastAPI(title="QRDM", description="QR Data Manager", version=VERSION)
 
@@ -23,36 +33,44 @@ app = FastAPI(title="QRDM", description="QR Data Manager", version=VERSION)
 @app.middleware("http")
 async def logging_middleware(request: Request, call_next) -> Response:
     """Middleware function for logging all incoming network requests."""
-    structlog.contextvars.clear_contextvars()
-    request_id = str(uuid.uuid4())
-    structlog.contextvars.bind_contextvars(request_id=request_id)
-    url = get_path_with_query_string(request.scope)
-    if request.client is not None:
-        client_host = request.client.host
-        client_port = request.client.port
-    else:
-        client_host, client_port = None, None
-    http_method = request.method
-    http_version = request.scope["http_version"]
+    _clear_contextvars()
+    # The request ID is only an opaque log-correlation token, so plain random hex
+    # is enough; it skips the UUID object construction and formatting of uuid4()
+    request_id = os.urandom(16).hex()
+    _bind_contextvars(request_id=request_id)
 
     # Pass request through to destination
     response = await call_next(request)
 
-    # Recreate the Uvicorn access log format
-    status_code = response.status_code
-    request_log_str = f"{http_method} {url} HTTP/{http_version} - {status_code}"
-    if request.client is not None:
-        request_log_str = " - ".join([f"{client_host}:{client_port}", request_log_str])
-    access_logger.info(
-        request_log_str,
-        http={
-            "url": str(request.url),
-            "status_code": status_code,
-            "method": http_method,
-            "version": http_version,
-        },
-        network={"client": {"ip": client_host, "port": client_port}},
-    )
+    # Skip access-log construction entirely when INFO records would be dropped,
+    # e.g. with QRDM_LOG_LEVEL=WARNING
+    if _access_std_logger.isEnabledFor(logging.INFO):
+        url = get_path_with_query_string(request.scope)
+        if request.client is not None:
+            client_host = request.client.host
+            client_port = request.client.port
+        else:
+            client_host, client_port = None, None
+        http_method = request.method
+        http_version = request.scope["http_version"]
+
+        # Recreate the Uvicorn access log format
+        status_code = response.status_code
+        version_str = _HTTP_VERSION_STRS.get(http_version) or f"HTTP/{http_version}"
+        request_log_str = f"{http_method} {url} {version_str} - {status_code}"
+        if request.client is not None:
+            request_log_str = f"{client_host}:{client_port} - {request_log_str}"
+        # Flat kwargs are passed straight through by structlog, avoiding the nested
+        # per-request dict allocations of the previous http=/network= structure
+        access_logger.info(
+            request_log_str,
+            http_url=str(request.url),
+            http_status=status_code,
+            http_method=http_method,
+            http_version=http_version,
+            client_ip=client_host,
+            client_port=client_port,
+        )
     return response
 
 
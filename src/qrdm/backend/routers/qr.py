@@ -4,23 +4,23 @@
 """FastAPI application router for QR encode & decode functions."""
 from __future__ import annotations
 
-import io
-from pathlib import Path
+import json
+import os
 from typing import Annotated, Optional
 
 import structlog
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import Response
-from pydantic import BaseModel, Json, JsonValue
+from pydantic import BaseModel
 
 from qrdm.backend.config import BackendSettings, get_backend_settings
 from qrdm.exceptions import QRDecodeError, QREncodeError
 from qrdm.models import DocumentPayload
-from qrdm.qr.decode import decode_qr_pdf
-from qrdm.qr.encode import encode_qr_pdf, get_file_content
 
 __all__ = ["router"]
 logger = structlog.get_logger()
+_bind_contextvars = structlog.contextvars.bind_contextvars
 
 router = APIRouter(tags=["QR Encoding & Decoding"])
 
@@ -29,23 +29,35 @@ class EncodeData(BaseModel):
     """`/encode` endpoint request data."""
 
     header_text: str = ""
-    encode_ec_codes: Optional[bool] = None
-    metadata: JsonValue = None
+    # Kept as the raw JSON string; `encode_qr_pdf` validates it once and encodes
+    # it as-is, avoiding a parse/re-serialize round trip per request
+    metadata: Optional[str] = None
     encoding: Optional[str] = None
 
     @classmethod
     def as_form_data(
         cls,
         header_text: Annotated[str, Form()] = "",
-        metadata: Annotated[Json, Form()] = None,
+        metadata: Annotated[Optional[str], Form()] = None,
         encoding: Annotated[Optional[str], Form()] = None,
     ) -> EncodeData:
         """Wrap the`EncodeData` constructor to accept HTTP Form data."""
+        if metadata is not None:
+            # Validate at the request boundary so malformed metadata stays a
+            # client error, while the raw string is still what gets passed
+            # through — `encode_qr_pdf` encodes it as-is, with no
+            # re-serialization
+            try:
+                json.loads(metadata)
+            except ValueError as e:
+                raise HTTPException(
+                    status_code=422, detail=f"metadata must be valid JSON: {e}"
+                )
         return cls(header_text=header_text, metadata=metadata, encoding=encoding)
 
 
 @router.post("/encode", summary="Encode a plaintext document as a PDF of QR codes")
-def encode_qr_endpoint(
+async def encode_qr_endpoint(
     document: Annotated[UploadFile, File()],
     settings: Annotated[BackendSettings, Depends(get_backend_settings)],
     body: EncodeData = Depends(EncodeData.as_form_data),
@@ -64,24 +76,31 @@ def encode_qr_endpoint(
       `charset_normalizer` package. Valid encodings can be found in the Python
       documentation: https://docs.python.org/3.9/library/codecs.html#standard-encodings
     """
+    # Imported here so that worker startup doesn't pay for the QR encoding stack
+    # before the first request arrives
+    from qrdm.qr.encode import encode_qr_pdf, get_file_content
+
     # upload_file = body.upload_file
-    file_data = document.file.read()
-    if document.filename is not None:
-        upload_filename = Path(document.filename)
-    else:
-        upload_filename = Path("document")
-    structlog.contextvars.bind_contextvars(
-        action="QR Encode", input_file={"filename": str(upload_filename)}
-    )
+    file_data = await document.read()
+    # Plain string splitting; only the basename and stem are needed, so Path
+    # construction would be pure overhead here
+    upload_filename = os.path.basename(document.filename or "document")
+    upload_stem, _ = os.path.splitext(upload_filename)
+    # Flat keys avoid a nested dict allocation per request
+    _bind_contextvars(action="QR Encode", input_file_filename=upload_filename)
 
     try:
         file_content = get_file_content(file_data, encoding=body.encoding)
-        logger.debug("Extracted file content: %r", file_content)
-        output_file_data = encode_qr_pdf(
+        # Log only the size; repr-ing a potentially multi-MB payload is wasted
+        # work whenever debug logging is off
+        logger.debug("Extracted file content", content_len=len(file_content))
+        # Offload the CPU-bound conversion so the event loop stays free for I/O
+        output_file_data = await run_in_threadpool(
+            encode_qr_pdf,
             document_content=file_content,
             header_text=body.header_text,
-            metadata=body.metadata,
-            document_name=upload_filename.name,
+            metadata_raw=body.metadata,
+            document_name=upload_filename,
             encode_ec_codes=settings.QRDM_ENCODE_EC_CODES,
             error_tolerance=settings.QRDM_ERROR_TOLERANCE,
         )
@@ -94,9 +113,9 @@ def encode_qr_endpoint(
         headers = {"QRErrorType": e.__class__.__name__}
         raise HTTPException(status_code=500, detail=msg, headers=headers)
 
-    output_filename = upload_filename.stem + "_qr.pdf"
+    output_filename = upload_stem + "_qr.pdf"
     logger.info(
-        f"Completed QR Conversion of {upload_filename!s}",
+        f"Completed QR Conversion of {upload_filename}",
         output_file={"filename": output_filename},
     )
     return Response(
@@ -111,7 +130,9 @@ def encode_qr_endpoint(
     response_model_exclude_none=True,
     summary="Reconstruct a source document from a QRDM PDF",
 )
-def decode_qr_endpoint(document: Annotated[UploadFile, File()]) -> DocumentPayload:
+async def decode_qr_endpoint(
+    document: Annotated[UploadFile, File()]
+) -> DocumentPayload:
     # FastAPI uses Markdown formatting for docstring rendering in Swagger, etc.
     """Reconstruct a source document from a QRDM PDF.
 
@@ -127,13 +148,18 @@ def decode_qr_endpoint(document: Annotated[UploadFile, File()]) -> DocumentPaylo
       field of the `/encode` endpoint.
 
     """
-    file_data = io.BytesIO(document.file.read())
-    structlog.contextvars.bind_contextvars(
-        action="QR Decode", input_file={"filename": str(document.filename)}
-    )
+    # Imported here so that worker startup doesn't pay for the QR decoding stack
+    # before the first request arrives
+    from qrdm.qr.decode import decode_qr_pdf
+
+    # `decode_qr_pdf` accepts the raw bytes directly; re-wrapping them in a
+    # `BytesIO` would double the upload's memory footprint
+    file_data = await document.read()
+    _bind_contextvars(action="QR Decode", input_file_filename=str(document.filename))
 
     try:
-        decoded_content = decode_qr_pdf(file_data)
+        # Offload the CPU-bound decode so the event loop stays free for I/O
+        decoded_content = await run_in_threadpool(decode_qr_pdf, file_data)
         if decoded_content is None:
             raise QRDecodeError("Could not locate any QR codes in document.")
     except Exception as e:
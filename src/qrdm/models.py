@@ -8,8 +8,9 @@ import base64
 import json
 import zlib
 from enum import Enum
+from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, JsonValue
+from pydantic import BaseModel, ConfigDict, Field, JsonValue, PrivateAttr
 
 from qrdm.qr import protobuf
 
@@ -88,6 +89,22 @@ class DocumentPayload(BaseModel):
     content: str = ""
     metadata: JsonValue = None
     model_config = ConfigDict(frozen=True)
+    # Original JSON serialization of `metadata`, when the caller already has one
+    # (e.g. the `/encode` form field); lets `_to_proto` skip re-serializing
+    _metadata_raw: Optional[str] = PrivateAttr(default=None)
+    # Compressed-serialization cache; the model is frozen, so the first dump
+    # stays valid for its lifetime
+    _compressed_bytes: Optional[bytes] = PrivateAttr(default=None)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare payloads by document state only.
+
+        The private attributes hold derived caches, not document state, so they
+        are excluded from equality (pydantic's default would compare them).
+        """
+        if not isinstance(other, DocumentPayload):
+            return NotImplemented
+        return (self.content, self.metadata) == (other.content, other.metadata)
 
     @classmethod
     def model_validate_protobuf_bytes(cls, b: bytes) -> DocumentPayload:
@@ -108,8 +125,8 @@ class DocumentPayload(BaseModel):
         return cls.model_validate_protobuf_bytes(inflated_bytes)
 
     def _to_proto(self) -> protobuf.DocumentPayload:
-        meta_str = None
-        if self.metadata is not None:
+        meta_str = self._metadata_raw
+        if meta_str is None and self.metadata is not None:
             meta_str = json.dumps(self.metadata)
         return protobuf.DocumentPayload(
             content=self.content.encode("utf-8"),
@@ -123,6 +140,14 @@ class DocumentPayload(BaseModel):
         return pb.SerializeToString()
 
     def model_dump_compressed_bytes(self) -> bytes:
-        """Serialize this object into compressed binary data."""
-        raw_bytes = self.model_dump_protobuf_bytes()
-        return zlib.compress(raw_bytes, level=zlib.Z_BEST_COMPRESSION)
+        """Serialize this object into compressed binary data.
+
+        The result is cached on the instance, so repeated dumps of the same
+        payload only pay for the protobuf serialization and compression once.
+        """
+        if self._compressed_bytes is None:
+            raw_bytes = self.model_dump_protobuf_bytes()
+            self._compressed_bytes = zlib.compress(
+                raw_bytes, level=zlib.Z_BEST_COMPRESSION
+            )
+        return self._compressed_bytes
@@ -1,12 +1,14 @@
 # Copyright 2024, Massachusetts Institute of Technology
 # Subject to FAR 52.227-11 - Patent Rights - Ownership by the Contractor (May 2014).
 # SPDX-License-Identifier: MIT
-import csv
 from enum import IntEnum
-from importlib import resources
 
 from qrcode import constants as qrconstants
 
+# The capacity table is generated from qr_capacity.csv at build time by
+# tools/gen_qr_capacity_table.py, so importing it costs no CSV parsing
+from qrdm.qr._qr_capacity_table import QR_CAPACITIES
+
 __all__ = [
     "BOX_SIZE",
     "EC_CODE_PROPORTION",
@@ -28,13 +30,3 @@ class ErrorCorrectionLevel(IntEnum):
     M = qrconstants.ERROR_CORRECT_M
     Q = qrconstants.ERROR_CORRECT_Q
     H = qrconstants.ERROR_CORRECT_H
-
-
-QR_CAPACITIES: dict[int, dict[str, int]] = {}
-qr_capacity_file_path = resources.files("qrdm.qr.data").joinpath("qr_capacity.csv")
-with qr_capacity_file_path.open() as f:
-    reader = csv.DictReader(f)
-    for ii, row in enumerate(reader, start=1):
-        QR_CAPACITIES[ii] = {
-            level.name: int(row[level.name]) for level in ErrorCorrectionLevel
-        }
@@ -9,17 +9,44 @@ import hashlib
 import io
 import logging
 import multiprocessing
+import os
+import tempfile
 import time
 import warnings
-from itertools import chain
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Optional, Union
 
 import fitz
-import reedsolo
+import numpy as np
 import structlog.contextvars
 from PIL import Image, ImageFilter
-from pyzbar.pyzbar import Decoded, ZBarSymbol, decode
+
+# zxing-cpp is the primary decoder: its C++ read releases the GIL, so the
+# thread-pool decode actually scales across cores. pyzbar is kept as a fallback
+# reader; it also covers environments where one of the native libraries is
+# unavailable.
+try:
+    from zxingcpp import BarcodeFormat, read_barcodes
+except ImportError:
+    read_barcodes = None
+
+try:
+    from pyzbar.pyzbar import ZBarSymbol
+    from pyzbar.pyzbar import decode as _pyzbar_decode
+except ImportError:
+    _pyzbar_decode = None
+
+if read_barcodes is None and _pyzbar_decode is None:
+    raise ImportError(
+        "QR decoding requires at least one of the 'zxing-cpp' or 'pyzbar' packages"
+    )
+
+try:
+    # Cython build of reedsolo; same API, roughly an order of magnitude faster
+    from creedsolo import RSCodec
+except ImportError:
+    from reedsolo import RSCodec
 
 from qrdm.exceptions import QRDecodeError
 from qrdm.models import DocumentPayload, QRContent
@@ -29,7 +56,9 @@ logger = logging.getLogger(__name__)
 
 
 def decode_qr_pdf(
-    input_file: Union[str, Path, bytes, io.BytesIO]
+    input_file: Union[str, Path, bytes, io.BytesIO],
+    *,
+    fast_path: bool = True,
 ) -> Optional[DocumentPayload]:
     """Decode a QRDM PDF into the original document content and metadata.
 
@@ -39,11 +68,17 @@ def decode_qr_pdf(
         Path to PDF file, binary stream, or bytes containing the file contents of the QR
         PDF. (e.g. as returned by `encode_qr_pdf`) Passed as input to the `fitz.open`
         function provided by PyMuPDF.
+    fast_path: bool, optional
+        When `True` (the default), the high-resolution re-render and the
+        image-enhancement retries are skipped as soon as enough QR codes have been
+        decoded for the error-correction codes to guarantee recovery. Set to `False`
+        to force those stages to run for every undecoded page, recovering as many
+        individual codes as possible.
 
     Returns
     -------
     decoded_document: DocumentPayload or `None`
-        If no QR codes are detected in the PDF by pyzbar, `None` is returned. Otherwise,
+        If no QR codes are detected in the PDF, `None` is returned. Otherwise,
         returns a Pydantic model containing the encoded document & metadata, with
         attributes:
 
@@ -63,16 +98,25 @@ def decode_qr_pdf(
 
     """
     if isinstance(input_file, (str, Path)):
-        doc = fitz.open(input_file, filetype="pdf")
+        pdf_path = os.fspath(input_file)
+        doc = fitz.open(pdf_path, filetype="pdf")
     else:
-        if isinstance(input_file, bytes):
-            stream = io.BytesIO(input_file)
-        else:
-            stream = input_file
-        doc = fitz.open(stream=stream, filetype="pdf")
-
-    extracted_images = _extract_page_images(doc)
-    extracted_contents = _extract_qr_contents_from_images(extracted_images)
+        # `fitz.open` accepts `bytes` directly; wrapping them in a `BytesIO` first
+        # would duplicate the whole file in memory
+        pdf_path = None
+        doc = fitz.open(stream=input_file, filetype="pdf")
+
+    # One central worker pool for the whole decode; the streaming passes and the
+    # enhancement retry all submit to it, rather than each spinning up their own
+    max_workers = _decode_worker_count()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        extracted_contents = _extract_qr_contents(
+            doc,
+            pdf_path=pdf_path,
+            executor=executor,
+            max_workers=max_workers,
+            fast_path=fast_path,
+        )
     logger.debug(f"Number of extracted payloads: {len(extracted_contents)}")
 
     if len(extracted_contents) == 0:
@@ -92,43 +136,248 @@ def decode_qr_pdf(
     return decoded_document
 
 
-def _extract_page_images(doc: fitz.Document) -> list[Image.Image]:
-    """Render PDF pages as a sequence of PNG images."""
-    logger.debug("Rendering PDF pages")
-    extracted_images = []
-    for page in doc:
-        page_pixmap: fitz.Pixmap = page.get_pixmap(dpi=300)
-        extracted_image = Image.open(io.BytesIO(page_pixmap.tobytes("png")))
-        extracted_images.append(extracted_image)
-    logger.debug("Rendered %d images from PDF Document", len(extracted_images))
-    return extracted_images
-
-
-def _extract_qr_contents_from_images(images: list[Image.Image]) -> dict[int, QRContent]:
-    """Decode QRDM QR code payloads contained in a sequence of images.
+RENDER_DPI = 300
+# First-pass resolution: QRDM codes are drawn at BOX_SIZE pt per module, so even
+# at half resolution each module still spans several pixels — comfortably above
+# zbar's locator requirements. Pages that fail at this resolution are re-rendered
+# at the full RENDER_DPI, so the downsample is purely an optimization.
+FAST_RENDER_DPI = 150
+
+
+def _render_page(pdf_path: str, page_index: int, dpi: int) -> tuple[int, int, bytes]:
+    """Render a single PDF page to raw grayscale samples; runs in worker processes."""
+    with fitz.open(pdf_path, filetype="pdf") as doc:
+        # Wrap the raw pixmap samples directly; a PNG round-trip here would pay a
+        # full libpng encode+decode per page. The barcode readers only consume
+        # luminance, so render grayscale with no alpha — 1 byte/pixel in every
+        # downstream buffer.
+        pix = doc[page_index].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY, alpha=False)
+        return pix.width, pix.height, bytes(pix.samples)
+
+
+def _extract_page_images(
+    doc: fitz.Document,
+    pdf_path: Optional[str] = None,
+    *,
+    dpi: int = RENDER_DPI,
+    page_indices: Optional[list[int]] = None,
+) -> Iterator[tuple[int, Image.Image]]:
+    """Render PDF pages lazily as `(page_index, PIL image)` pairs.
+
+    Multi-page documents are rasterized in parallel across worker processes, since
+    page rendering is CPU-bound inside MuPDF. Workers re-open the document by
+    path; stream-based input is spooled to a temporary file once. Renders are
+    submitted through a bounded in-flight window and yielded as they complete
+    (not necessarily in page order), so only O(workers) rasters exist in the
+    pool at any moment regardless of document length. `page_indices` restricts
+    the render to a subset of pages, e.g. when re-rendering failed pages at a
+    higher resolution.
+    """
+    if page_indices is None:
+        page_indices = list(range(doc.page_count))
+    logger.debug("Rendering %d PDF pages at %d DPI", len(page_indices), dpi)
+    if len(page_indices) <= 1:
+        # Not worth the process spin-up for a single page
+        for page_index in page_indices:
+            pix = doc[page_index].get_pixmap(
+                dpi=dpi, colorspace=fitz.csGRAY, alpha=False
+            )
+            yield page_index, Image.frombytes("L", (pix.width, pix.height), pix.samples)
+        return
 
-    Includes attempts at image enhancement if the expected number of QR codes are not
-    successfully decoded.
+    tmp_path = None
+    try:
+        if pdf_path is None:
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+                f.write(doc.tobytes())
+                tmp_path = pdf_path = f.name
+        max_workers = min(len(page_indices), multiprocessing.cpu_count())
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+            in_flight: dict[concurrent.futures.Future, int] = {}
+
+            def _drain(futures):
+                for fut in futures:
+                    page_index = in_flight.pop(fut)
+                    width, height, samples = fut.result()
+                    yield page_index, Image.frombytes("L", (width, height), samples)
+
+            for page_index in page_indices:
+                fut = pool.submit(_render_page, pdf_path, page_index, dpi)
+                in_flight[fut] = page_index
+                if len(in_flight) >= 2 * max_workers:
+                    done, _ = concurrent.futures.wait(
+                        in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    yield from _drain(done)
+            yield from _drain(list(in_flight))
+    finally:
+        if tmp_path is not None:
+            os.unlink(tmp_path)
+
+
+def _streaming_decode_pass(
+    pages: Iterable[tuple[int, Image.Image]],
+    *,
+    executor: concurrent.futures.ThreadPoolExecutor,
+    max_workers: int,
+    extracted_contents: dict[int, QRContent],
+    page_results: dict[int, tuple[Image.Image, set[int]]],
+) -> int:
+    """Decode pages as they are rendered, recording each page's yield.
+
+    Pages are handed to the decode worker pool as they arrive, with a bounded
+    in-flight window so decoding keeps pace with rendering. Each page's raster
+    is retained in `page_results` together with the sequence numbers it
+    yielded, so the retry stages can target any page whose coverage turns out
+    to be incomplete — not just pages that produced nothing. Returns the number
+    of pages consumed.
+    """
+    n_images = 0
+    in_flight: dict[concurrent.futures.Future, tuple[int, Image.Image]] = {}
+
+    def _drain(futures) -> None:
+        for fut in futures:
+            page_index, img = in_flight.pop(fut)
+            page_decodes = fut.result()
+            page_contents = _parse_qr_contents(page_decodes) if page_decodes else {}
+            extracted_contents.update(page_contents)
+            page_results[page_index] = (img, set(page_contents))
+
+    for page_index, img in pages:
+        n_images += 1
+        fut = executor.submit(_decode_qr_job, img)
+        in_flight[fut] = (page_index, img)
+        if len(in_flight) >= 2 * max_workers:
+            done, _ = concurrent.futures.wait(
+                in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            _drain(done)
+    _drain(list(in_flight))
+    return n_images
+
+
+def _retry_page_indices(
+    page_results: dict[int, tuple[Image.Image, set[int]]],
+    extracted_contents: dict[int, QRContent],
+) -> list[int]:
+    """Select pages that may still hold undecoded QR codes.
+
+    Codes are laid out in sequence order, so each page carries a contiguous run
+    of sequence numbers. A page can only be ruled out as a retry candidate when
+    its observed run is gap-free and the sequence numbers just beyond both ends
+    of the run were decoded elsewhere (or fall outside the document); any other
+    page may be hiding a missed code, even if it yielded some payloads.
+    """
+    if not extracted_contents:
+        return sorted(page_results)
+    total_qr_codes = next(iter(extracted_contents.values())).meta.total_qr_codes
+    if len(extracted_contents) >= total_qr_codes:
+        return []
+    retry_indices = []
+    for page_index, (_, page_seqs) in sorted(page_results.items()):
+        if not page_seqs:
+            retry_indices.append(page_index)
+            continue
+        lo, hi = min(page_seqs), max(page_seqs)
+        internally_complete = len(page_seqs) == hi - lo + 1
+        sealed_below = lo == 0 or (lo - 1) in extracted_contents
+        sealed_above = hi == total_qr_codes - 1 or (hi + 1) in extracted_contents
+        if not (internally_complete and sealed_below and sealed_above):
+            retry_indices.append(page_index)
+    return retry_indices
+
+
+def _decode_worker_count() -> int:
+    """Determine the worker count for the shared decode thread pool.
+
+    The decode jobs spend nearly all their time in native barcode readers that
+    release the GIL, so the pool is oversubscribed relative to the CPU count to
+    keep cores busy through each job's Python-side setup and teardown.
     """
     try:
-        max_workers = multiprocessing.cpu_count()
+        return max(8, 2 * multiprocessing.cpu_count())
     except NotImplementedError as e:
         logger.warning(f"Failed to get cpu count for multithreading with error: {e}")
         logger.debug("Defaulting to 10 worker threads")
-        max_workers = min(10, len(images))
+        return 10
 
-    extracted_contents = {}
-    logger.debug(f"Decoding QRs from {len(images)} input images")
+
+def _extract_qr_contents(
+    doc: fitz.Document,
+    pdf_path: Optional[str] = None,
+    *,
+    executor: concurrent.futures.ThreadPoolExecutor,
+    max_workers: int,
+    fast_path: bool = True,
+) -> dict[int, QRContent]:
+    """Decode QRDM QR code payloads contained in a PDF document.
+
+    Pages are first rendered at `FAST_RENDER_DPI`, which is sufficient for clean
+    rasters at a quarter of the pixel count of the full resolution; any pages
+    whose sequence-number coverage is incomplete are re-rendered at `RENDER_DPI`
+    before falling back to the image-enhancement retry. With `fast_path`, both
+    fallback stages are skipped once the decoded codes are sufficient for
+    reconstruction. All decode work is submitted to the provided shared
+    `executor`.
+    """
+    extracted_contents: dict[int, QRContent] = {}
+    page_results: dict[int, tuple[Image.Image, set[int]]] = {}
+    logger.debug("Decoding QRs from input images")
     start_time = time.time()
-    extracted_contents = _batch_decode_qr_imgs(images, max_workers=max_workers)
+    n_images = _streaming_decode_pass(
+        _extract_page_images(doc, pdf_path, dpi=FAST_RENDER_DPI),
+        executor=executor,
+        max_workers=max_workers,
+        extracted_contents=extracted_contents,
+        page_results=page_results,
+    )
+    retry_indices = _retry_page_indices(page_results, extracted_contents)
+    if retry_indices and (
+        not fast_path or not _sufficient_decodes(extracted_contents)
+    ):
+        logger.debug(
+            "Re-rendering %d retry pages at %d DPI", len(retry_indices), RENDER_DPI
+        )
+        # The low-resolution rasters are superseded by the full-resolution
+        # re-renders, for the enhancement retry as well
+        page_results = {}
+        _streaming_decode_pass(
+            _extract_page_images(
+                doc, pdf_path, dpi=RENDER_DPI, page_indices=retry_indices
+            ),
+            executor=executor,
+            max_workers=max_workers,
+            extracted_contents=extracted_contents,
+            page_results=page_results,
+        )
+        retry_indices = _retry_page_indices(page_results, extracted_contents)
     total_time = time.time() - start_time
-    logger.debug(f"Decoded {len(extracted_contents)} codes in {total_time:0.4f}s")
+    logger.debug(
+        f"Decoded {len(extracted_contents)} codes "
+        f"from {n_images} images in {total_time:0.4f}s"
+    )
+
+    if len(extracted_contents) > 0:
+        qr_info = structlog.contextvars.get_contextvars().get("qr_info", {})
+        qr_info.update(
+            {
+                "qr_meta": next(iter(extracted_contents.values())).meta.model_dump(
+                    exclude={"sequence_number"}
+                )
+            }
+        )
+        structlog.contextvars.bind_contextvars(qr_info=qr_info)
 
     # Check if enough qrs were found for document decoding
-    if not _sufficient_decodes(extracted_contents):
-        logger.debug("Not enough QRs decoded, attempting image enhancement")
+    if retry_indices and (
+        not fast_path or not _sufficient_decodes(extracted_contents)
+    ):
+        logger.debug("Attempting image enhancement on retry pages")
         new_contents = _batch_filter_and_decode_qr_imgs(
-            images, existing_contents=extracted_contents, max_workers=max_workers
+            [page_results[ii][0] for ii in retry_indices],
+            existing_contents=extracted_contents,
+            executor=executor,
+            stop_when_sufficient=fast_path,
         )
         extracted_contents.update(new_contents)
         logger.debug(
@@ -164,37 +413,64 @@ def _reconstruct_document_payload(
         )
         raise QRDecodeError(msg)
 
-    doc_fragments: dict[int, bytes] = {
-        seq: contents.doc_fragment for (seq, contents) in extracted_contents.items()
-    }
-    max_payload_len = max(len(fragment) for fragment in doc_fragments.values())
+    max_payload_len = max(
+        len(contents.doc_fragment) for contents in extracted_contents.values()
+    )
 
+    # One contiguous payload matrix, filled straight from the received
+    # fragments; rows for missing codes stay zeroed and are marked as erasures.
+    # The matrix serves both the column-wise Reed-Solomon decode and the final
+    # row-major concatenation without any intermediate per-fragment copies.
+    payload_matrix = np.zeros((total_qr_codes, max_payload_len), dtype=np.uint8)
     dropped_code_inds = []
     for seq_num in range(total_qr_codes):
-        if seq_num not in extracted_contents:
-            logger.debug(f"Missing code: {seq_num}")
+        contents = extracted_contents.get(seq_num)
+        if contents is None:
+            logger.debug("Missing code: %d", seq_num)
             dropped_code_inds.append(seq_num)
-            doc_fragments[seq_num] = b"\0" * max_payload_len
+            continue
+        fragment = contents.doc_fragment
+        payload_matrix[seq_num, : len(fragment)] = np.frombuffer(
+            fragment, dtype=np.uint8
+        )
 
-    sorted_payload_tuples = sorted(doc_fragments.items(), key=lambda tuple: tuple[0])
-    sorted_payloads = [t[1] for t in sorted_payload_tuples]
-    logger.debug(
-        "Directly extracted payloads: %r", [p.hex(" ", 4) for p in sorted_payloads]
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Directly extracted payloads: %r",
+            [row.tobytes().hex(" ", 4) for row in payload_matrix],
+        )
 
     if num_ecc > 0:
         logger.debug("Checking error-correction codes")
-        received_symbols = list(zip(*sorted_payloads))
-        decoding_codec = reedsolo.RSCodec(num_ecc)
-        fixed_symbols = [
-            decoding_codec.decode(x, erase_pos=dropped_code_inds, only_erasures=True)[0]
-            for x in received_symbols
+        received_symbols = [
+            payload_matrix[:, jj].tobytes() for jj in range(max_payload_len)
         ]
-        sorted_payloads = [bytes(x) for x in zip(*fixed_symbols)]
-        logger.debug("Post-EC payloads: %r", [p.hex(" ", 4) for p in sorted_payloads])
+        fixed_symbols = _rs_decode_columns(
+            received_symbols, num_ecc=num_ecc, erase_pos=dropped_code_inds
+        )
+        # The decoded columns drop the ECC symbols; transposing back row-major
+        # yields the concatenated data payloads directly
+        n_data_codes = total_qr_codes - num_ecc
+        total_payload_bytes = (
+            np.frombuffer(b"".join(fixed_symbols), dtype=np.uint8)
+            .reshape(max_payload_len, n_data_codes)
+            .T.tobytes()
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Post-EC payloads: %r",
+                [
+                    total_payload_bytes[
+                        ii * max_payload_len : (ii + 1) * max_payload_len
+                    ].hex(" ", 4)
+                    for ii in range(n_data_codes)
+                ],
+            )
+    else:
+        total_payload_bytes = payload_matrix.tobytes()
 
-    total_payload_bytes = b"".join(sorted_payloads)
-    logger.debug("Concatenated total payload: %s", total_payload_bytes.hex(" ", 4))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Concatenated total payload: %s", total_payload_bytes.hex(" ", 4))
 
     h = hashlib.shake_256(total_payload_bytes.strip(b"\0"))
     hash_bytes_check = h.digest(8)
@@ -214,64 +490,148 @@ def _reconstruct_document_payload(
     return output
 
 
-def _batch_decode_qr_imgs(
-    images: list[Image.Image],
-    max_workers: Optional[int] = None,
-    threaded_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None,
-) -> dict[int, QRContent]:
-    """Decode a sequence of QR images into their corresponding data payloads."""
-    # Multithreaded Mode
-    if threaded_executor:
-        # Use provided thread pool
-        decodes = list(threaded_executor.map(_pyzbar_decode_qr_job, images))
-    else:
-        # Initialize threadpool for single use
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            decodes = list(executor.map(_pyzbar_decode_qr_job, images))
-    # unpacking results
-    flattened_decodes = []
-    flattened_decodes = list(chain(*decodes))
-    qr_contents = _parse_qr_contents(flattened_decodes)
-
-    if len(qr_contents) > 0:
-        qr_info = structlog.contextvars.get_contextvars().get("qr_info", {})
-        qr_info.update(
-            {
-                "qr_meta": next(iter(qr_contents.values())).meta.model_dump(
-                    exclude={"sequence_number"}
-                )
-            }
-        )
-        structlog.contextvars.bind_contextvars(qr_info=qr_info)
+# Below this many byte columns, the Reed-Solomon decode is cheaper than process
+# pool spin-up and runs serially
+_RS_PARALLEL_MIN_COLUMNS = 256
+
+# Worker-process state for the parallel Reed-Solomon column decode; the codec's
+# lookup tables are built once per worker by the pool initializer instead of
+# being pickled with every task
+_rs_worker_codec: Optional[RSCodec] = None
+_rs_worker_erase_pos: list[int] = []
+
+
+def _init_rs_worker(num_ecc: int, erase_pos: list[int]) -> None:
+    global _rs_worker_codec, _rs_worker_erase_pos
+    _rs_worker_codec = RSCodec(num_ecc)
+    _rs_worker_erase_pos = erase_pos
 
-    return qr_contents
 
+def _rs_decode_column(column: bytes) -> bytes:
+    assert _rs_worker_codec is not None
+    decoded = _rs_worker_codec.decode(
+        column, erase_pos=_rs_worker_erase_pos, only_erasures=True
+    )[0]
+    return bytes(decoded)
 
-def _pyzbar_decode_qr_job(img: Image.Image) -> list[Decoded]:
-    return decode(img, symbols=[ZBarSymbol.QRCODE])
 
+def _rs_decode_columns(
+    received_symbols: list[bytes], *, num_ecc: int, erase_pos: list[int]
+) -> list[bytes]:
+    """Run the erasure-only Reed-Solomon decode over each byte column.
 
-def _parse_qr_contents(decodes: list[Decoded]) -> dict[int, QRContent]:
-    """Parse a list of pyzbar decodes into ordered set of QRContents."""
+    The columns are independent codewords, so large documents are decoded in
+    parallel across worker processes; small ones are decoded serially with a
+    single shared codec.
+    """
+    if len(received_symbols) >= _RS_PARALLEL_MIN_COLUMNS:
+        max_workers = min(
+            multiprocessing.cpu_count(),
+            len(received_symbols) // _RS_PARALLEL_MIN_COLUMNS + 1,
+        )
+        if max_workers > 1:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_rs_worker,
+                initargs=(num_ecc, erase_pos),
+            ) as pool:
+                return list(
+                    pool.map(_rs_decode_column, received_symbols, chunksize=64)
+                )
+
+    decoding_codec = RSCodec(num_ecc)
+    return [
+        bytes(decoding_codec.decode(x, erase_pos=erase_pos, only_erasures=True)[0])
+        for x in received_symbols
+    ]
+
+
+# RFC 1924 base85 alphabet, as used by `base64.b85encode`
+_B85_ALPHABET = (
+    b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    b"abcdefghijklmnopqrstuvwxyz!#$%&()*+-;<=>?@^_`{|}~"
+)
+_B85_DECODE_TABLE = np.full(256, 0xFF, dtype=np.uint8)
+_B85_DECODE_TABLE[np.frombuffer(_B85_ALPHABET, dtype=np.uint8)] = np.arange(
+    len(_B85_ALPHABET), dtype=np.uint8
+)
+_B85_CHUNK_WEIGHTS = np.array(
+    [85**4, 85**3, 85**2, 85, 1], dtype=np.uint64
+)
+_B85_BYTE_SHIFTS = np.array([24, 16, 8, 0], dtype=np.uint64)
+
+
+def _b85decode(b: bytes) -> bytes:
+    """Vectorized equivalent of `base64.b85decode`.
+
+    The stdlib decode loops in Python over every 5-character group; decoding all
+    groups of a payload at once as a numpy matrix product removes that per-chunk
+    interpreter cost from the per-QR parse path.
+    """
+    padding = -len(b) % 5
+    if padding:
+        b = b + b"~" * padding
+    digits = _B85_DECODE_TABLE[np.frombuffer(b, dtype=np.uint8)]
+    if (digits == 0xFF).any():
+        raise ValueError("bad base85 character")
+    accs = digits.reshape(-1, 5).astype(np.uint64) @ _B85_CHUNK_WEIGHTS
+    if (accs > 0xFFFFFFFF).any():
+        raise ValueError("base85 overflow in hunk")
+    decoded = ((accs[:, None] >> _B85_BYTE_SHIFTS) & 0xFF).astype(np.uint8).tobytes()
+    if padding:
+        decoded = decoded[:-padding]
+    return decoded
+
+
+def _decode_qr_job(img: Image.Image) -> list[bytes]:
+    """Read all QR payloads from an image, as raw bytes.
+
+    zxing-cpp releases the GIL during the read, so these jobs run concurrently
+    on the shared thread pool. Images that zxing cannot read are retried with
+    pyzbar when it is available, since the two locators fail on different
+    degradations.
+    """
+    if read_barcodes is not None:
+        results = read_barcodes(np.asarray(img), formats=BarcodeFormat.QRCode)
+        payloads = [r.bytes for r in results]
+        if payloads or _pyzbar_decode is None:
+            return payloads
+    return [d.data for d in _pyzbar_decode(img, symbols=[ZBarSymbol.QRCODE])]
+
+
+def _parse_qr_contents(decodes: list[bytes]) -> dict[int, QRContent]:
+    """Parse a list of decoded QR payloads into ordered set of QRContents."""
+    # The hex dumps below allocate a formatted string per QR; hoist the level
+    # check so suppressed debug logging costs nothing in this hot loop
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
     extracted_contents = {}
-    for ii, qr in enumerate(decodes):
-        logger.debug(f"Parsing decode {ii+1} of {len(decodes)}")
+    for ii, qr_data in enumerate(decodes):
+        if debug_enabled:
+            logger.debug("Parsing decode %d of %d", ii + 1, len(decodes))
         try:
-            content = QRContent.model_validate_b85_bytes(qr.data)
+            # Current payloads are bit-inverted protobuf, which always begins
+            # with the inverted tag byte of the `meta` field (0xF5) — outside
+            # the (ASCII) base85 alphabet of legacy payloads.
+            if qr_data.startswith(b"\xf5"):
+                raw = np.invert(np.frombuffer(qr_data, dtype=np.uint8)).tobytes()
+                content = QRContent.model_validate_protobuf_bytes(raw)
+            else:
+                content = QRContent.model_validate_protobuf_bytes(_b85decode(qr_data))
         except Exception as e:
             raise QRDecodeError("Could not read QR payload") from e
         extracted_contents[content.meta.sequence_number] = content
 
-        logger.debug(
-            "Recovered QR #%d payload with metadata: %r",
-            content.meta.sequence_number,
-            dict(content.meta),
-        )
-        logger.debug(
-            "Recovered QR #%d payload with content: %s",
-            content.meta.sequence_number,
-            content.doc_fragment.hex(" ", 4),
-        )
+        if debug_enabled:
+            logger.debug(
+                "Recovered QR #%d payload with metadata: %r",
+                content.meta.sequence_number,
+                dict(content.meta),
+            )
+            logger.debug(
+                "Recovered QR #%d payload with content: %s",
+                content.meta.sequence_number,
+                content.doc_fragment.hex(" ", 4),
+            )
 
     return extracted_contents
 
@@ -279,38 +639,54 @@ def _parse_qr_contents(decodes: list[Decoded]) -> dict[int, QRContent]:
 def _batch_filter_and_decode_qr_imgs(
     images: list[Image.Image],
     existing_contents: Optional[dict[int, QRContent]] = None,
-    max_workers: Optional[int] = None,
+    *,
+    executor: concurrent.futures.ThreadPoolExecutor,
+    stop_when_sufficient: bool = True,
 ) -> dict[int, QRContent]:
-    """Apply a image filters to page images to attempt to decode additional QR codes."""
+    """Apply image filters to page images to attempt to decode additional QR codes.
+
+    Only pages that may still hold undecoded QR codes reach this function at
+    all, and images are dropped from the retry set as soon as any blur pass
+    recovers QR payloads from them — so each successive pass only re-blurs and
+    re-decodes the still-unresolved pages, and each page is decoded successfully
+    at most once across the whole cascade. Decode work runs on the shared
+    `executor`.
+    """
     if existing_contents is None:
         existing_contents = {}
     extracted_contents = existing_contents.copy()
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        for blur_radius in [2, 3, 4]:
-            # blur all images
-            blurred_imgs = [_box_blur(img, blur_radius) for img in images]
-            # run zbar
-            new_contents = _batch_decode_qr_imgs(
-                blurred_imgs, threaded_executor=executor
-            )
-            extracted_contents.update(new_contents)
-            # check if sufficient decodes
-            if _sufficient_decodes(extracted_contents):
-                break
-
-            # double blur all images
-            db_blurred_imgs = [_box_blur(img, blur_radius) for img in blurred_imgs]
-            # run zbar
-            new_contents = _batch_decode_qr_imgs(
-                db_blurred_imgs, threaded_executor=executor
-            )
-            extracted_contents.update(new_contents)
-            # check if sufficient decodes
-            if _sufficient_decodes(extracted_contents):
-                break
+    # The barcode readers only consume luminance, so convert to grayscale once
+    # up front; every blur pass then traverses 1 byte/pixel instead of 3
+    retry_images = [
+        img if img.mode == "L" else img.convert("L") for img in images
+    ]
+    for blur_radius in _RETRY_BLUR_RADII:
+        if not retry_images:
+            return extracted_contents
+        blurred_imgs = [_box_blur(img, blur_radius) for img in retry_images]
+        # run zbar
+        decodes = list(executor.map(_decode_qr_job, blurred_imgs))
+        still_undecoded = []
+        for img, page_decodes in zip(retry_images, decodes):
+            if page_decodes:
+                extracted_contents.update(_parse_qr_contents(page_decodes))
+            else:
+                still_undecoded.append(img)
+        retry_images = still_undecoded
+        # check if sufficient decodes
+        if stop_when_sufficient and _sufficient_decodes(extracted_contents):
+            return extracted_contents
     return extracted_contents
 
 
+# Escalating single-pass blur strengths for the decode retry. The former
+# double-blur passes at radii 2/3/4 are folded in here as the single box blur of
+# matching variance (two passes of radius r ≈ one pass of radius r' with
+# r'(r'+1) = 2r(r+1)), so each retry now traverses the raster once instead of
+# twice.
+_RETRY_BLUR_RADII = (2, 3, 4, 5, 6)
+
+
 def _box_blur(img: Image.Image, kernel_size: int) -> Image.Image:
     """Apply a box filter blur of `kernel_size` to an image."""
     blurred_img = img.filter(ImageFilter.BoxBlur(kernel_size))
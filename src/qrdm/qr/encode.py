@@ -5,24 +5,31 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import hashlib
 import io
+import json
 import logging
+import multiprocessing
 import shutil
 import warnings
-from collections.abc import Iterator
 from math import ceil
 from pathlib import Path
 from typing import Optional, Union, overload
 
-import qrcode.image.svg as qr_svg
-import reedsolo
+import numpy as np
 import structlog
 from charset_normalizer import from_bytes
 from pydantic import JsonValue
 from qrcode.main import QRCode
 from structlog import contextvars
 
+try:
+    # Cython build of reedsolo; same API, roughly an order of magnitude faster
+    from creedsolo import RSCodec
+except ImportError:
+    from reedsolo import RSCodec
+
 import qrdm.qr._const as qr_const
 from qrdm.exceptions import QREncodeError
 from qrdm.models import DocumentPayload, ECSettingValues, QRContent, QRMeta
@@ -45,6 +52,7 @@ def encode_qr_pdf(
     path: None = ...,
     header_text: str = ...,
     metadata: Optional[JsonValue] = ...,
+    metadata_raw: Optional[str] = ...,
     document_name: Optional[str] = ...,
     encode_ec_codes: bool = ...,
     error_tolerance: Union[str, ECSettingValues] = ...,
@@ -58,6 +66,7 @@ def encode_qr_pdf(
     path: Union[PathLike, io.BufferedIOBase] = ...,
     header_text: str = ...,
     metadata: Optional[JsonValue] = ...,
+    metadata_raw: Optional[str] = ...,
     document_name: Optional[str] = ...,
     encode_ec_codes: bool = ...,
     error_tolerance: Union[str, ECSettingValues] = ...,
@@ -70,6 +79,7 @@ def encode_qr_pdf(
     path: Optional[Union[PathLike, io.BufferedIOBase]] = None,
     header_text: str = "",
     metadata: Optional[JsonValue] = None,
+    metadata_raw: Optional[str] = None,
     document_name: Optional[str] = None,
     encode_ec_codes: bool = True,
     error_tolerance: Union[str, ECSettingValues] = ECSettingValues.M,
@@ -90,6 +100,10 @@ def encode_qr_pdf(
         JSON-encodable data that is encoded alongside the document contents in the QR
         PDF. (I.e. may be a JSON-scalar `[str|bool|int|float]` or a `dict[str,
         JsonValue]`)
+    metadata_raw: str, optional
+        Pre-serialized JSON string of the document metadata, as an alternative to
+        `metadata`. The string is validated and encoded as-is, skipping a JSON
+        re-serialization. Takes precedence over `metadata` if both are provided.
     document_name: str, optional
         Name of the original file or document, to label output PDF.
     encode_ec_codes: bool, optional
@@ -118,7 +132,17 @@ def encode_qr_pdf(
     if isinstance(error_tolerance, str):
         error_tolerance = ECSettingValues(error_tolerance)
 
+    if metadata_raw is not None:
+        # Parse once for validation & the model's metadata field; the original
+        # string is kept so serialization doesn't repeat the json.dumps
+        try:
+            metadata = json.loads(metadata_raw)
+        except ValueError as e:
+            raise QREncodeError("metadata is not valid JSON") from e
+
     document_payload = DocumentPayload(content=document_content, metadata=metadata)
+    if metadata_raw is not None:
+        document_payload._metadata_raw = metadata_raw
     qr_payloads = generate_qr_payloads(
         document_payload,
         encode_ec_codes=encode_ec_codes,
@@ -188,10 +212,14 @@ def generate_qr_payloads(
     encode_ec_codes: bool,
     error_tolerance: ECSettingValues = ECSettingValues.M,
 ) -> list[bytes]:
-    """Construct b85-encoded payloads from a document for QR code construction."""
+    """Construct serialized payloads from a document for QR code construction."""
     logger.debug("Generating QR code payloads")
     total_payload_bytes = document_content.model_dump_compressed_bytes()
-    logger.debug("Compressed document: %s", total_payload_bytes.hex(" ", 4))
+    # Hex dumps of whole payloads are eager-formatted at the call site, so gate
+    # them on the debug level rather than paying for the strings unconditionally
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug("Compressed document: %s", total_payload_bytes.hex(" ", 4))
 
     h = hashlib.shake_256(total_payload_bytes.strip(b"\0"))
     hash_bytes = h.digest(8)
@@ -199,19 +227,17 @@ def generate_qr_payloads(
     document_hash = int.from_bytes(hash_bytes, "big")
 
     max_qr_bytes = qr_const.QR_CAPACITIES[qr_const.QR_SIZE][error_tolerance.name]
+    # Payloads are emitted as raw protobuf bytes in QR Byte mode, so the full
+    # capacity is usable — the former b85 text encoding cost 25% of it
     single_qr_payload_size = max_qr_bytes - PROTOBUF_RESERVED_LEN
-    # Reduce payload size to account for b85 inflation
-    single_qr_payload_size = (single_qr_payload_size // 5) * 4
 
     # If document is small enough to fit in a single code, skip `_split_file_content` to
     # avoid the null-byte padding
     if len(total_payload_bytes) <= single_qr_payload_size:
         payload_fragments = [total_payload_bytes]
     else:
-        payload_fragments = list(
-            _split_file_content(
-                total_payload_bytes, maximum_length=single_qr_payload_size
-            )
+        payload_fragments = _split_file_content(
+            total_payload_bytes, maximum_length=single_qr_payload_size
         )
 
     n_raw_fragments = len(payload_fragments)
@@ -253,20 +279,28 @@ def generate_qr_payloads(
             total_qr_codes=total_qr_codes,
             num_ecc=num_ecc,
         )
-        logger.debug(
-            "Constructing QR #%d payload with metadata: {%s}",
-            sequence_number,
-            dict(qr_meta),
-        )
-        logger.debug(
-            "Constructing QR #%d payload with content: %s",
-            sequence_number,
-            fragment.hex(" ", -4),
-        )
+        if debug_enabled:
+            logger.debug(
+                "Constructing QR #%d payload with metadata: {%s}",
+                sequence_number,
+                dict(qr_meta),
+            )
+            logger.debug(
+                "Constructing QR #%d payload with content: %s",
+                sequence_number,
+                fragment.hex(" ", -4),
+            )
         qr_content = QRContent(meta=qr_meta, doc_fragment=fragment)
-        qr_b64_content = qr_content.model_dump_b85_bytes()
-        logger.debug("QR b85-encoded size: %d", len(qr_b64_content))
-        qr_contents.append(qr_b64_content)
+        # The payload is stored bit-inverted: the null padding of the final
+        # fragment would otherwise form all-zero Reed-Solomon blocks inside the
+        # QR encoder, which the qrcode library cannot process. Inversion also
+        # maps the protobuf tag byte outside the base85 alphabet, letting the
+        # decoder distinguish this format from legacy b85 payloads.
+        qr_payload = np.invert(
+            np.frombuffer(qr_content.model_dump_protobuf_bytes(), dtype=np.uint8)
+        ).tobytes()
+        logger.debug("QR payload size: %d", len(qr_payload))
+        qr_contents.append(qr_payload)
 
         contextvars.bind_contextvars(
             qr_info={
@@ -278,52 +312,145 @@ def generate_qr_payloads(
     return qr_contents
 
 
-def _split_file_content(content: bytes, *, maximum_length: int) -> Iterator[bytes]:
+def _split_file_content(content: bytes, *, maximum_length: int) -> list[bytes]:
     """Split an array of bytes into chunks of *equal* length n, null padding when required.
 
     Equal-length chunks are required for generating error-correction QR codes.
+    The split is a single zero-padded numpy reshape rather than a Python slicing
+    loop, so no per-chunk slice copies are made.
     """
-    while len(content) > maximum_length:
-        yield content[:maximum_length]
-        content = content[maximum_length:]
-    yield content + b"\0" * (maximum_length - len(content))
+    n_chunks = max(ceil(len(content) / maximum_length), 1)
+    buf = np.zeros(n_chunks * maximum_length, dtype=np.uint8)
+    buf[: len(content)] = np.frombuffer(content, dtype=np.uint8)
+    return [row.tobytes() for row in buf.reshape(n_chunks, maximum_length)]
+
+
+# Below this many byte columns, the Reed-Solomon encode is cheaper than process
+# pool spin-up and runs serially
+_RS_PARALLEL_MIN_COLUMNS = 256
+
+# Worker-process state for the parallel Reed-Solomon column encode; the codec's
+# lookup tables are built once per worker by the pool initializer instead of
+# being pickled with every task
+_rs_worker_codec: Optional[RSCodec] = None
+
+
+def _init_rs_worker(num_ecc: int) -> None:
+    global _rs_worker_codec
+    _rs_worker_codec = RSCodec(num_ecc)
+
+
+def _rs_encode_column(column: bytes) -> bytes:
+    assert _rs_worker_codec is not None
+    return bytes(_rs_worker_codec.encode(column))
 
 
 def _generate_ec_fragments(
     payload_fragments: list[bytes], *, num_ecc: int
 ) -> list[bytes]:
-    """Construct arrays of error-correction data from a list of QR payloads."""
+    """Construct arrays of error-correction data from a list of QR payloads.
+
+    The byte columns of the payload matrix are independent codewords, so large
+    documents are encoded in parallel across worker processes; small ones are
+    encoded serially with a single shared codec. The matrix transposes use numpy
+    views rather than Python-level `zip(*...)` tuple construction.
+    """
     logger.debug("Constructing %d error correction QR codes", num_ecc)
-    groups = [bytes(x) for x in zip(*payload_fragments)]
+    n_fragments = len(payload_fragments)
+    fragment_len = len(payload_fragments[0])
+    payload_matrix = np.frombuffer(
+        b"".join(payload_fragments), dtype=np.uint8
+    ).reshape(n_fragments, fragment_len)
+    groups = [payload_matrix[:, jj].tobytes() for jj in range(fragment_len)]
     try:
-        encoding_rs_codec = reedsolo.RSCodec(num_ecc)
-        output_fragments = [
-            bytes(x)
-            for x in zip(*(encoding_rs_codec.encode(group) for group in groups))
-        ]
+        encoded_columns = None
+        if fragment_len >= _RS_PARALLEL_MIN_COLUMNS:
+            max_workers = min(
+                multiprocessing.cpu_count(),
+                fragment_len // _RS_PARALLEL_MIN_COLUMNS + 1,
+            )
+            if max_workers > 1:
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    initializer=_init_rs_worker,
+                    initargs=(num_ecc,),
+                ) as pool:
+                    encoded_columns = list(
+                        pool.map(_rs_encode_column, groups, chunksize=64)
+                    )
+        if encoded_columns is None:
+            encoding_rs_codec = RSCodec(num_ecc)
+            encoded_columns = [bytes(encoding_rs_codec.encode(g)) for g in groups]
     except ValueError as e:
         raise QREncodeError("Error: Could not construct error-correction codes.") from e
-    return output_fragments
+    encoded_len = len(encoded_columns[0])
+    encoded_matrix = np.frombuffer(
+        b"".join(encoded_columns), dtype=np.uint8
+    ).reshape(fragment_len, encoded_len)
+    return [encoded_matrix[:, ii].tobytes() for ii in range(encoded_len)]
+
+
+# Below this many codes, QR construction is cheaper than process pool spin-up
+# and runs serially
+_QR_BUILD_PARALLEL_MIN_CODES = 32
+
+
+def _build_qr_code(
+    code_content: bytes, error_correction: int, mask_pattern: Optional[int]
+) -> QRCode:
+    """Construct a single QRCode; runs in worker processes for large documents."""
+    code = QRCode(
+        version=None,
+        error_correction=error_correction,
+        box_size=qr_const.BOX_SIZE,
+        border=0,
+        mask_pattern=mask_pattern,
+    )
+    code.add_data(code_content, optimize=0)
+    code.make(fit=True)
+    return code
 
 
 def generate_qr_codes(
-    qr_contents: list[bytes], error_tolerance: ECSettingValues = ECSettingValues.M
+    qr_contents: list[bytes],
+    error_tolerance: ECSettingValues = ECSettingValues.M,
+    *,
+    skip_mask_optimization: bool = False,
 ) -> list[QRCode]:
-    """Generate a sequence of QRCodes from ASCII payloads."""
+    """Generate a sequence of QRCodes from serialized payloads.
+
+    Each code's construction is independent, so large documents are built in
+    parallel across worker processes. `skip_mask_optimization` presets the QR
+    mask pattern instead of scoring all eight candidates — `best_mask_pattern`
+    dominates `QRCode.make`'s runtime, and any fixed mask still yields a valid,
+    scannable code.
+    """
     logger.debug("Generating QR codes")
-    image_factory = qr_svg.SvgPathImage
-    qr_codes = []
-    for code_content in qr_contents:
-        code = QRCode(
-            version=None,
-            error_correction=qr_const.ErrorCorrectionLevel[error_tolerance.name],
-            box_size=qr_const.BOX_SIZE,
-            image_factory=image_factory,
-            border=0,
-        )
-        logger.debug("Constructing QR with payload: " f"{code_content[:32]!r}...")
-        code.add_data(code_content, optimize=0)
-        code.make(fit=True)
-        logger.debug(f"Code size: {code.version}")
-        qr_codes.append(code)
+    error_correction = qr_const.ErrorCorrectionLevel[error_tolerance.name]
+    mask_pattern = 0 if skip_mask_optimization else None
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    if len(qr_contents) >= _QR_BUILD_PARALLEL_MIN_CODES:
+        max_workers = min(multiprocessing.cpu_count(), len(qr_contents))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+            qr_codes = list(
+                pool.map(
+                    _build_qr_code,
+                    qr_contents,
+                    [error_correction] * len(qr_contents),
+                    [mask_pattern] * len(qr_contents),
+                )
+            )
+    else:
+        qr_codes = [
+            _build_qr_code(code_content, error_correction, mask_pattern)
+            for code_content in qr_contents
+        ]
+    if debug_enabled:
+        for code_content, code in zip(qr_contents, qr_codes):
+            logger.debug(
+                "Constructed size-%s QR with payload: %r...",
+                code.version,
+                code_content[:32],
+            )
     return qr_codes
@@ -11,14 +11,15 @@ from importlib import resources
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 from qrcode.main import QRCode
-from reportlab.graphics import renderPDF
 from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
+from reportlab.lib.units import inch, mm
 from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfgen import canvas
-from svglib.svglib import Drawing, svg2rlg
 
+import qrdm.qr._const as qr_const
 from qrdm import __version__ as QRDM_VERSION
 
 __all__ = ["generate_pdf_pages"]
@@ -27,6 +28,13 @@ logger = logging.getLogger(__name__)
 # Document Constants
 AUTHOR_NAME = f"QRDM v{QRDM_VERSION}"
 LOGO_PATH = resources.files("qrdm.qr.data").joinpath("qrdm_logo_red.png")
+# Populated lazily by `_get_logo`
+_LOGO_IMAGE_READER: Optional[ImageReader] = None
+# Warm the font-registry lookups for the caption and default canvas fonts once
+# at import, so neither the first page of an encode nor the first encode of a
+# batch pays for them
+pdfmetrics.getFont("Courier")
+pdfmetrics.getFont("Helvetica")
 
 # Layout Parameters
 # Upper left corner of QR region
@@ -43,6 +51,22 @@ QR_MARGIN_PX: float = 0.25 * inch
 CAPTION_CHAR_WIDTH: int = 192
 MAX_CHAR_LIMIT: int = 45 * 192  # num_lines * CAPTION_CHAR_WIDTH
 
+# On-page size of one QR module; matches the BOX_SIZE/10 mm per module that the
+# SVG image factory emitted, so layouts are unchanged
+MODULE_PX: float = qr_const.BOX_SIZE * mm / 10
+
+# Maps control characters to the printable escape sequences `repr` would emit,
+# so captions can be escaped in one C-level `str.translate` pass instead of
+# repr's full quoted-copy construction
+_CAPTION_ESCAPE_TABLE = {
+    **{ii: f"\\x{ii:02x}" for ii in range(32)},
+    ord("\t"): "\\t",
+    ord("\n"): "\\n",
+    ord("\r"): "\\r",
+    ord("\\"): "\\\\",
+    0x7F: "\\x7f",
+}
+
 
 def generate_pdf_pages(
     qr_codes: list[QRCode],
@@ -57,8 +81,8 @@ def generate_pdf_pages(
     Parameters
     ----------
     qr_codes: list[QRCode]
-        List of `qrcode.QRCode` objects, configured to use the `SvgPathImage` image
-        factory.
+        List of built `qrcode.QRCode` objects; only their module matrices are
+        read, so no image factory is required.
     buf: Writeable binary stream object
         Stream that PDF file will be written to.
     header_text: str, optional
@@ -71,21 +95,32 @@ def generate_pdf_pages(
         not `None`. Defaults to `None`.
 
     """
-    # Render QR codes as images, and convert to reportlab-compatible Drawings
-    qr_imgs = _generate_qr_code_svgs(qr_codes=qr_codes)
-    reportlab_qrs = _format_reportlab_img(imgs=qr_imgs)
+    # `Canvas.save` issues many small writes (xref entries, per-object stream
+    # headers); give raw unbuffered sinks a real buffer so each one doesn't
+    # cost a syscall
+    if isinstance(buf, io.RawIOBase):
+        buf = io.BufferedWriter(buf, buffer_size=64 * 1024)
+
+    # Sort QR codes by size, so layout algorithm can safely assume that rows won't
+    # grow in height; the sort is stable, so equal-size codes keep their order
+    sorted_qr_codes = sorted(qr_codes, key=lambda code: code.version, reverse=True)
 
     # Calculate positions of QR codes based on their dimensions, and whether space
-    # is reserved for text content
+    # is reserved for text content; only the module counts are needed, so the
+    # matrices themselves are read lazily at draw time
     include_text = qr_text is not None
     page_qrs, page_qr_positions = _get_qr_positions_per_page(
-        reportlab_qrs=reportlab_qrs, include_text=include_text
+        qr_module_counts=[code.modules_count for code in sorted_qr_codes],
+        include_text=include_text,
     )
-    # Split up text across number of pages
+    # Make escape characters printable. Pages index directly into this one
+    # string, so the text is never copied into per-page chunks
     if include_text:
-        page_qr_text = _split_text_across_pages(qr_text)
+        caption_text = qr_text.translate(_CAPTION_ESCAPE_TABLE)
+        n_text_pages = -(-len(caption_text) // MAX_CHAR_LIMIT)
     else:
-        page_qr_text = []
+        caption_text = ""
+        n_text_pages = 0
 
     logger.debug("QRS_PER_PAGE: %r", page_qrs)
     logger.debug("QRS_POSITIONS: %r", page_qr_positions)
@@ -110,61 +145,98 @@ def generate_pdf_pages(
     c.setAuthor(AUTHOR_NAME)
     c.setTitle(doc_title)
 
+    # The header and the footer prefix repeat on every page, so their string
+    # widths are measured once; only the page-number suffix is measured per page
+    header_x = 4.25 * inch - c.stringWidth(header_text) / 2
+    footer_prefix_width = c.stringWidth(footer_text)
+
+    # The header text and logo are identical on every page, so they are
+    # rendered once into a Form XObject and replayed per page; only the footer,
+    # whose page-number suffix varies, is drawn fresh each time
+    c.beginForm("page_header")
+    _draw_page_header(c, header_text=header_text, header_x=header_x)
+    c.endForm()
+
     for page_index, qr_range in enumerate(page_qrs, start=1):
         logger.debug(f"Redering PDF page {page_index} of {len(page_qrs)}")
-        page_footer_text = footer_text + f", Page {page_index} of {len(page_qrs)}"
-        _draw_header_footer(c, header_text=header_text, footer_text=page_footer_text)
+        c.doForm("page_header")
+        footer_suffix = f", Page {page_index} of {len(page_qrs)}"
+        footer_x = (
+            4.25 * inch - (footer_prefix_width + c.stringWidth(footer_suffix)) / 2
+        )
+        c.drawString(footer_x, 0.5 * inch, footer_text + footer_suffix)
 
         for j in range(qr_range[0], qr_range[1]):
+            # Each matrix is materialized just long enough to draw it, so peak
+            # memory stays flat in the number of codes
             _draw_qr_on_canvas(
-                c, rendered_qr=reportlab_qrs[j], pos=page_qr_positions[j]
+                c, matrix=sorted_qr_codes[j].get_matrix(), pos=page_qr_positions[j]
             )
 
-        if include_text and page_index <= (len(page_qr_text)):
-            # Check if we're on the last page, and there's more text chunks than pages
-            if (page_index == len(page_qrs)) and (len(page_qr_text) > len(page_qrs)):
-                remaining_chars = sum(len(text) for text in page_qr_text[page_index:])
+        if include_text and page_index <= n_text_pages:
+            # Check if we're on the last page, and there's more text than pages
+            if (page_index == len(page_qrs)) and (n_text_pages > len(page_qrs)):
+                remaining_chars = len(caption_text) - page_index * MAX_CHAR_LIMIT
                 _add_overflow_notice(c, remaining_chars=remaining_chars)
-            _add_page_caption(c, text=page_qr_text[page_index - 1])
+            _add_page_caption(
+                c,
+                text=caption_text,
+                start=(page_index - 1) * MAX_CHAR_LIMIT,
+                end=min(page_index * MAX_CHAR_LIMIT, len(caption_text)),
+            )
 
         # Cycle to next page
         c.showPage()
     c.save()
-
-
-def _generate_qr_code_svgs(qr_codes: list[QRCode]) -> list[io.BytesIO]:
-    # Sort QR codes by size, so layout algorithm can safely assume that rows won't
-    # grow in height
-    qr_sizes = [code.version for code in qr_codes]
-    # This is just a python list version of `np.argsort`
-    code_size_order = sorted(
-        range(len(qr_sizes)), key=qr_sizes.__getitem__, reverse=True
-    )
-    sorted_qr_codes = [qr_codes[ii] for ii in code_size_order]
-    imgs = []
-    for code in sorted_qr_codes:
-        img = code.make_image()
-        img_byte_stream = io.BytesIO(initial_bytes=img.to_string())
-        imgs.append(img_byte_stream)
-    return imgs
+    buf.flush()
 
 
 def _draw_qr_on_canvas(
-    c: canvas.Canvas, *, rendered_qr: Drawing, pos: tuple[int, int]
+    c: canvas.Canvas, *, matrix: list[list[bool]], pos: tuple[int, int]
 ) -> None:
-    # Load the image into reportlab image class, scale and draw
-    renderPDF.draw(rendered_qr, c, pos[0], pos[1] - rendered_qr.height)
+    qr_size_px = len(matrix) * MODULE_PX
+    # Place via the transformation matrix, so the path itself is emitted in
+    # compact QR-local coordinates
+    c.saveState()
+    c.translate(pos[0], pos[1] - qr_size_px)
+    _draw_qr_modules_direct(c, matrix, MODULE_PX)
+    c.restoreState()
 
 
-def _format_reportlab_img(imgs: list[io.BytesIO]) -> list[Drawing]:
-    reportlab_qrs = []
-    for img in imgs:
-        reportlab_qrs.append(svg2rlg(img))
-    return reportlab_qrs
+def _draw_qr_modules_direct(
+    c: canvas.Canvas, matrix: list[list[bool]], module_px: float
+) -> None:
+    """Draw a QR module matrix as a single filled path at the canvas origin.
+
+    Runs of consecutive dark modules within a row are merged into one rectangle,
+    so the emitted PDF content stream carries far fewer path operations than one
+    rect per module.
+    """
+    n_rows = len(matrix)
+    path = c.beginPath()
+    for ii, row in enumerate(matrix):
+        # Matrix row 0 is the top of the code; reportlab's origin is bottom-left
+        rect_y = (n_rows - ii - 1) * module_px
+        n_cols = len(row)
+        jj = 0
+        while jj < n_cols:
+            if row[jj]:
+                run_start = jj
+                while jj < n_cols and row[jj]:
+                    jj += 1
+                path.rect(
+                    run_start * module_px,
+                    rect_y,
+                    (jj - run_start) * module_px,
+                    module_px,
+                )
+            else:
+                jj += 1
+    c.drawPath(path, fill=1, stroke=0)
 
 
 def _get_qr_positions_per_page(
-    *, reportlab_qrs: list[Drawing], include_text: bool = True
+    *, qr_module_counts: list[int], include_text: bool = True
 ):
     logger.debug("Calculating QR page positions")
     page_qr_positions = []
@@ -178,14 +250,24 @@ def _get_qr_positions_per_page(
         # It does not include .5 top margin, that's included e
         min_y_px = 0.75 * inch
 
+    # Codes are generated against a single target version, so documents are
+    # almost always a uniform grid that has a closed-form layout; mixed sizes
+    # (e.g. an undersized final code) fall through to the per-QR walk below
+    qr_sizes = set(qr_module_counts)
+    if len(qr_sizes) == 1:
+        return _uniform_grid_layout(
+            qr_sizes.pop() * MODULE_PX, len(qr_module_counts), min_y_px=min_y_px
+        )
+
     cur_x_px = START_X_PX
     cur_y_px = START_Y_PX
     last_h_px = 0
     qr_counter = 0
 
-    for ii, rendered_qr in enumerate(reportlab_qrs):
-        qr_h_px = rendered_qr.height
-        qr_w_px = rendered_qr.width
+    for ii, n_modules in enumerate(qr_module_counts):
+        # QR codes are square, n_modules on a side
+        qr_h_px = n_modules * MODULE_PX
+        qr_w_px = qr_h_px
 
         enough_horizontal_space = cur_x_px + qr_w_px <= MAX_X_PX
         if not enough_horizontal_space:
@@ -210,51 +292,87 @@ def _get_qr_positions_per_page(
         else:
             raise RuntimeError("Unable to fit QR code on page!")
 
-    page_qrs.append((qr_counter, len(reportlab_qrs)))
+    page_qrs.append((qr_counter, len(qr_module_counts)))
     return page_qrs, page_qr_positions
 
 
-def _split_text_across_pages(text: str) -> list[str]:
-    # Make escape characters printable with `repr`
-    # Slice [1:] to remove opening quote char, trailing quote handled by the -1 in
-    # `breakpoints` below
-    caption_text = repr(text)[1:]
-    # Chunk text into substings of length MAX_CHAR_LIMIT
-    breakpoints = [*list(range(0, len(caption_text), MAX_CHAR_LIMIT)), -1]
-    page_text = [
-        caption_text[breakpoints[ii] : breakpoints[ii + 1]]
-        for ii in range(len(breakpoints) - 1)
+def _uniform_grid_layout(qr_size_px: float, n_codes: int, *, min_y_px: float):
+    # How many codes fit per row & rows per page; counted with the same
+    # accumulating float arithmetic as the per-QR walk so pagination can never
+    # disagree between the two paths
+    per_row = 0
+    cur_x_px = START_X_PX
+    while cur_x_px + qr_size_px <= MAX_X_PX:
+        per_row += 1
+        cur_x_px += qr_size_px + QR_MARGIN_PX
+    rows_per_page = 0
+    cur_y_px = START_Y_PX
+    while cur_y_px - qr_size_px >= min_y_px:
+        rows_per_page += 1
+        cur_y_px -= qr_size_px + QR_MARGIN_PX
+    if per_row < 1 or rows_per_page < 1:
+        raise RuntimeError("Unable to fit QR code on page!")
+
+    # Positions for one full page, in typewriter order
+    xs = START_X_PX + np.arange(per_row) * (qr_size_px + QR_MARGIN_PX)
+    ys = START_Y_PX - np.arange(rows_per_page) * (qr_size_px + QR_MARGIN_PX)
+    grid_x, grid_y = np.meshgrid(xs, ys)
+    page_grid = np.column_stack([grid_x.ravel(), grid_y.ravel()])
+
+    per_page = per_row * rows_per_page
+    n_pages = -(-n_codes // per_page)
+    positions = np.tile(page_grid, (n_pages, 1))[:n_codes]
+    page_qrs = [
+        (pp * per_page, min((pp + 1) * per_page, n_codes)) for pp in range(n_pages)
     ]
-    return page_text
+    return page_qrs, [tuple(pos) for pos in positions]
+
+
+def _get_logo() -> ImageReader:
+    # The logo is identical on every page, so the PNG is read and decoded once;
+    # `ImageReader` retains the decoded pixel data across `drawImage` calls
+    global _LOGO_IMAGE_READER
+    if _LOGO_IMAGE_READER is None:
+        with LOGO_PATH.open("rb") as imgfile:
+            _LOGO_IMAGE_READER = ImageReader(io.BytesIO(imgfile.read()))
+    return _LOGO_IMAGE_READER
 
 
-def _draw_header_footer(
-    c: canvas.Canvas, *, header_text: str, footer_text: str
+def _draw_page_header(
+    c: canvas.Canvas, *, header_text: str, header_x: float
 ) -> None:
-    c.drawCentredString(4.25 * inch, 0.25 * inch, header_text)
-    c.drawCentredString(4.25 * inch, 10.5 * inch, header_text)
-    c.drawCentredString(4.25 * inch, 0.5 * inch, footer_text)
+    # The x coordinate is a precomputed centering, so `drawString` skips the
+    # per-call width measurement `drawCentredString` would repeat on every page.
+    # `header_text` defaults to "", so don't push empty strings through the
+    # text-drawing pipeline
+    if header_text:
+        c.drawString(header_x, 0.25 * inch, header_text)
+        c.drawString(header_x, 10.5 * inch, header_text)
     # Draw QRDM logo
-    with LOGO_PATH.open("rb") as imgfile:
-        logo_img = ImageReader(imgfile)
-        c.drawImage(
-            logo_img,
-            x=START_X_PX,
-            y=START_Y_PX + inch / 4,
-            width=inch / 4,
-            preserveAspectRatio=True,
-            mask="auto",
-            anchor="sw",
-        )
+    c.drawImage(
+        _get_logo(),
+        x=START_X_PX,
+        y=START_Y_PX + inch / 4,
+        width=inch / 4,
+        preserveAspectRatio=True,
+        mask="auto",
+        anchor="sw",
+    )
 
 
-def _add_page_caption(c: canvas.Canvas, text: str) -> None:
+def _add_page_caption(c: canvas.Canvas, *, text: str, start: int, end: int) -> None:
+    # Caption the [start, end) slice of the full document text; only the
+    # per-line substrings handed to reportlab are ever copied out
     textobject = c.beginText()
     textobject.setFont("Courier", size=5)
     textobject.setTextOrigin(0.25 * inch, MIN_Y_PX)
     char_line_width = CAPTION_CHAR_WIDTH
-    for ii in range(0, len(text), char_line_width):
-        textobject.textLine(text[ii : ii + char_line_width])
+    textobject.textLines(
+        [
+            text[ii : min(ii + char_line_width, end)]
+            for ii in range(start, end, char_line_width)
+        ]
+    )
     c.drawText(textobject)
 
 
@@ -0,0 +1,12 @@
+# Copyright 2024, Massachusetts Institute of Technology
+# Subject to FAR 52.227-11 - Patent Rights - Ownership by the Contractor (May 2014).
+# SPDX-License-Identifier: MIT
+"""Serialization-overhead constants for the QRDM protobuf messages.
+
+Generated by `tools/gen_protobuf_constants.py`. Do not edit by hand; edit the
+generator (or the `.proto` definitions it measures) and regenerate instead.
+"""
+
+__all__ = ["PROTOBUF_RESERVED_LEN"]
+
+PROTOBUF_RESERVED_LEN = 67
@@ -34,6 +34,15 @@ def test_qr_encode():
     assert response.is_success
 
 
+def test_qr_encode_malformed_metadata():
+    response = client.post(
+        "/encode",
+        files={"document": ("payload.txt", payload.encode("utf-8"))},
+        data={"metadata": "{not json"},
+    )
+    assert response.status_code == 422
+
+
 @pytest.mark.parametrize(
     "metadata",
     [None, "Test data", {"author": "MIT Lincoln Laboratory"}],
@@ -1,10 +1,12 @@
 # Copyright 2024, Massachusetts Institute of Technology
 # Subject to FAR 52.227-11 - Patent Rights - Ownership by the Contractor (May 2014).
 # SPDX-License-Identifier: MIT
+import base64
 import io
 import random
 import shutil
 
+import numpy as np
 import pytest
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
@@ -112,3 +114,56 @@ def test_trailing_null_payload():
     recomposed_document_payload = decode.decode_qr_pdf(input_file=pdf_file_data)
     assert recomposed_document_payload is not None
     assert recomposed_document_payload.content == null_payload
+
+
+def _as_legacy_b85_payloads(qr_payloads: list[bytes]) -> list[bytes]:
+    # Earlier releases stored QR payloads as base85 text of the serialized
+    # protobuf; undo the current format's bit inversion to reconstruct that
+    # format exactly
+    return [
+        base64.b85encode(np.invert(np.frombuffer(p, dtype=np.uint8)).tobytes())
+        for p in qr_payloads
+    ]
+
+
+def test_decode_legacy_b85_pdf():
+    document_payload = DocumentPayload(content=payload_cyrillic)
+    qr_payloads = encode.generate_qr_payloads(document_payload, encode_ec_codes=False)
+    legacy_payloads = _as_legacy_b85_payloads(qr_payloads)
+    qr_codes = encode.generate_qr_codes(legacy_payloads)
+    pdf_file_stream = io.BytesIO()
+    pdf_writer.generate_pdf_pages(qr_codes=qr_codes, buf=pdf_file_stream)
+    recomposed_document_payload = decode.decode_qr_pdf(input_file=pdf_file_stream)
+    assert recomposed_document_payload is not None
+    assert recomposed_document_payload == document_payload
+
+
+def test_qr_payload_format_discrimination():
+    document_payload = DocumentPayload(content=payload_cyrillic)
+    (inverted_payload,) = encode.generate_qr_payloads(
+        document_payload, encode_ec_codes=False
+    )
+    (legacy_payload,) = _as_legacy_b85_payloads([inverted_payload])
+    # Inverted-protobuf payloads always lead with 0xF5, which lies outside the
+    # base85 alphabet, so the first byte is sufficient to tell the formats apart
+    assert inverted_payload.startswith(b"\xf5")
+    assert not legacy_payload.startswith(b"\xf5")
+    parsed_inverted = decode._parse_qr_contents([inverted_payload])
+    parsed_legacy = decode._parse_qr_contents([legacy_payload])
+    assert parsed_inverted == parsed_legacy
+
+
+def test_protobuf_reserved_len_in_sync():
+    # The baked constant must match a fresh measurement of the message overhead
+    import sys
+    from pathlib import Path
+
+    from qrdm.qr.protobuf import PROTOBUF_RESERVED_LEN
+
+    generator_path = Path(__file__).parent.parent / "tools" / "gen_protobuf_constants.py"
+    sys.path.insert(0, str(generator_path.parent))
+    try:
+        import gen_protobuf_constants
+    finally:
+        sys.path.pop(0)
+    assert PROTOBUF_RESERVED_LEN == gen_protobuf_constants.compute_reserved_len()
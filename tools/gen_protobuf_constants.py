@@ -0,0 +1,70 @@
+# Copyright 2024, Massachusetts Institute of Technology
+# Subject to FAR 52.227-11 - Patent Rights - Ownership by the Contractor (May 2014).
+# SPDX-License-Identifier: MIT
+"""Generate `qrdm.qr.protobuf._constants` from the protobuf message definitions.
+
+The generated module ships `PROTOBUF_RESERVED_LEN` as a plain int literal so
+that importing it costs no protobuf message construction at runtime. Run from
+the repository root:
+
+    python tools/gen_protobuf_constants.py
+
+The build hook in `setup.py` also runs this script, so the generated module
+stays in sync with the `.proto` definitions at package build time.
+"""
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONSTANTS_PATH = REPO_ROOT / "src" / "qrdm" / "qr" / "protobuf" / "_constants.py"
+
+HEADER = '''\
+# Copyright 2024, Massachusetts Institute of Technology
+# Subject to FAR 52.227-11 - Patent Rights - Ownership by the Contractor (May 2014).
+# SPDX-License-Identifier: MIT
+"""Serialization-overhead constants for the QRDM protobuf messages.
+
+Generated by `tools/gen_protobuf_constants.py`. Do not edit by hand; edit the
+generator (or the `.proto` definitions it measures) and regenerate instead.
+"""
+
+__all__ = ["PROTOBUF_RESERVED_LEN"]
+
+'''
+
+
+def compute_reserved_len() -> int:
+    """Measure the maximum serialization overhead of a `QRContent` message."""
+    # Import the checkout's generated protobuf module without leaving `src` on
+    # `sys.path` for callers (the sync test imports this function directly)
+    sys.path.insert(0, str(REPO_ROOT / "src"))
+    try:
+        from qrdm.qr.protobuf.qrdm_pb2 import QRContent
+    finally:
+        sys.path.pop(0)
+
+    max_len_qr_meta = QRContent.QRMeta(
+        document_hash=2**64 - 1,
+        sequence_number=2**32 - 1,
+        total_qr_codes=2**32 - 1,
+        num_ecc=2**32 - 1,
+    )
+    max_varint_len = 10
+    # Each length-delimited field (i.e. the QRMeta submessage and the bytes-type
+    # payload) of the message includes a "tag" and "length", each as a varint
+    return max_len_qr_meta.ByteSize() + 4 * max_varint_len
+
+
+def generate_constants() -> str:
+    """Render the constants-module source."""
+    return HEADER + f"PROTOBUF_RESERVED_LEN = {compute_reserved_len()}\n"
+
+
+def main() -> None:
+    """Regenerate the constants module in place."""
+    CONSTANTS_PATH.write_text(generate_constants())
+    print(f"Wrote {CONSTANTS_PATH}")
+
+
+if __name__ == "__main__":
+    main()
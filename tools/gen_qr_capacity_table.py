@@ -0,0 +1,59 @@
+# Copyright 2024, Massachusetts Institute of Technology
+# Subject to FAR 52.227-11 - Patent Rights - Ownership by the Contractor (May 2014).
+# SPDX-License-Identifier: MIT
+"""Generate `qrdm.qr._qr_capacity_table` from the bundled `qr_capacity.csv`.
+
+The generated module ships a plain dict literal so that importing the capacity
+table costs no file I/O or CSV parsing at runtime. Run from the repository root:
+
+    python tools/gen_qr_capacity_table.py
+
+The build hook in `setup.py` also runs this script, so the generated module
+stays in sync with the CSV at package build time.
+"""
+import csv
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CSV_PATH = REPO_ROOT / "src" / "qrdm" / "qr" / "data" / "qr_capacity.csv"
+TABLE_PATH = REPO_ROOT / "src" / "qrdm" / "qr" / "_qr_capacity_table.py"
+
+HEADER = '''\
+# Copyright 2024, Massachusetts Institute of Technology
+# Subject to FAR 52.227-11 - Patent Rights - Ownership by the Contractor (May 2014).
+# SPDX-License-Identifier: MIT
+"""QR binary-mode capacity table, in bytes, by version and error correction level.
+
+Generated from `qrdm/qr/data/qr_capacity.csv` by `tools/gen_qr_capacity_table.py`.
+Do not edit by hand; edit the CSV and regenerate instead.
+"""
+
+__all__ = ["QR_CAPACITIES"]
+
+'''
+
+EC_LEVELS = ("L", "M", "Q", "H")
+
+
+def generate_table(csv_path: Path = CSV_PATH) -> str:
+    """Render the capacity-table module source from the CSV contents."""
+    with csv_path.open(newline="") as f:
+        reader = csv.DictReader(f)
+        rows = list(reader)
+
+    lines = [HEADER, "QR_CAPACITIES: dict[int, dict[str, int]] = {\n"]
+    for version, row in enumerate(rows, start=1):
+        cells = ", ".join(f'"{level}": {int(row[level])}' for level in EC_LEVELS)
+        lines.append(f"    {version}: {{{cells}}},\n")
+    lines.append("}\n")
+    return "".join(lines)
+
+
+def main() -> None:
+    """Regenerate the capacity-table module in place."""
+    TABLE_PATH.write_text(generate_table())
+    print(f"Wrote {TABLE_PATH}")
+
+
+if __name__ == "__main__":
+    main()